@@ -7,8 +7,11 @@ Verifie TOUTES les mises a jour d'Anthropic, met a jour la Mini App, et envoie d
 import os
 import json
 import hashlib
+import html
 import requests
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -31,6 +34,12 @@ TELEGRAM_CHAT_IDS = [
 CACHE_FILE = Path("cache/last_check.json")
 WEBAPP_DATA_FILE = Path("docs/data.json")
 
+# Cache disque des pages d'articles (cle = hash de l'URL, eviction LRU)
+PAGE_CACHE_DIR = Path("cache/pages")
+PAGE_CACHE_MAX_BYTES = 20 * 1024 * 1024  # 20 Mo
+ENRICH_MAX_WORKERS = 4
+ENRICH_SOURCES = ["Blog", "Recherche"]
+
 # URL de la Mini App (GitHub Pages)
 GITHUB_USERNAME = "fanatik0192"
 REPO_NAME = "claude-updates-monitor"
@@ -129,6 +138,125 @@ def get_hash(content):
     return hashlib.md5(content.encode()).hexdigest()[:16]
 
 
+def page_cache_path(url):
+    """Chemin du fichier de cache pour une URL (adresse par contenu de l'URL)."""
+    return PAGE_CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.html"
+
+
+def load_cached_page(url):
+    """Lit une page depuis le cache disque, ou None si absente."""
+    path = page_cache_path(url)
+    if not path.exists():
+        return None
+    try:
+        text = path.read_text(encoding="utf-8")
+        # Touche le fichier pour que l'eviction LRU le garde
+        os.utime(path)
+        return text
+    except OSError:
+        return None
+
+
+def save_cached_page(url, text):
+    """Ecrit une page dans le cache disque (ecriture atomique)."""
+    PAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = page_cache_path(url)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[ERREUR] Cache pages: {e}")
+        tmp.unlink(missing_ok=True)
+
+
+def prune_page_cache(max_bytes=PAGE_CACHE_MAX_BYTES):
+    """Supprime les pages les moins recemment utilisees au-dela de max_bytes."""
+    if not PAGE_CACHE_DIR.exists():
+        return
+
+    entries = []
+    for path in PAGE_CACHE_DIR.glob("*.html"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+
+    if removed:
+        print(f"[CACHE] {removed} pages evincees ({total // 1024} Ko restants)")
+
+
+def extract_article_summary(page):
+    """Extrait la description (meta / OpenGraph) ou le premier paragraphe d'un article."""
+    soup = BeautifulSoup(page, "html.parser")
+
+    for attrs in [{"name": "description"}, {"property": "og:description"},
+                  {"name": "twitter:description"}]:
+        tag = soup.find("meta", attrs=attrs)
+        content = tag.get("content", "").strip() if tag else ""
+        if content:
+            return content[:400] + "..." if len(content) > 400 else content
+
+    container = soup.find("article") or soup.find("main") or soup
+    for p in container.find_all("p"):
+        text = p.get_text(" ", strip=True)
+        if len(text) > 60:
+            return text[:400] + "..." if len(text) > 400 else text
+
+    return ""
+
+
+def fetch_article_page(url):
+    """Recupere une page d'article, depuis le cache disque si possible."""
+    page = load_cached_page(url)
+    if page is not None:
+        return page, True
+
+    response = requests.get(url, timeout=15, headers={"User-Agent": "Mozilla/5.0"})
+    response.raise_for_status()
+    save_cached_page(url, response.text)
+    return response.text, False
+
+
+def enrich_articles(updates):
+    """Complete le resume des articles Blog/Recherche a partir de leur page."""
+    targets = [u for u in updates
+               if u["source"] in ENRICH_SOURCES and not u.get("summary") and u.get("url")]
+    if not targets:
+        return
+
+    def enrich(update):
+        try:
+            page, cached = fetch_article_page(update["url"])
+            update["summary"] = extract_article_summary(page)
+            return cached
+        except Exception as e:
+            print(f"[ERREUR] Enrichissement {update['url']}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=ENRICH_MAX_WORKERS) as executor:
+        results = list(executor.map(enrich, targets))
+
+    prune_page_cache()
+
+    downloaded = sum(1 for r in results if r is False)
+    cached = sum(1 for r in results if r is True)
+    print(f"[INFO] Enrichissement: {downloaded} telechargees, {cached} depuis le cache")
+
+
 def send_telegram(message, chat_id=None, parse_mode="HTML", reply_markup=None):
     """Envoie un message Telegram a un ou plusieurs destinataires."""
     if not TELEGRAM_BOT_TOKEN:
@@ -484,7 +612,12 @@ def generate_telegram_message(new_updates, versions):
             }.get(update['source'], '📌')
 
             title = update['title'][:40] + "..." if len(update['title']) > 40 else update['title']
-            msg += f"{emoji} <b>{update['source']}</b>\n   └ {title}\n\n"
+            msg += f"{emoji} <b>{update['source']}</b>\n   └ {title}\n"
+            if update['source'] in ENRICH_SOURCES and update.get('summary'):
+                summary = update['summary']
+                summary = summary[:120] + "..." if len(summary) > 120 else summary
+                msg += f"   <i>{html.escape(summary)}</i>\n"
+            msg += "\n"
 
         if len(new_updates) > 5:
             msg += f"<i>+ {len(new_updates) - 5} autres...</i>\n\n"
@@ -595,6 +728,9 @@ A demain 20h ! 🚀
     print("[RECUPERATION] Depots GitHub...")
     all_updates.extend(fetch_github_anthropic_repos())
 
+    print("[ENRICHISSEMENT] Articles Blog/Recherche...")
+    enrich_articles(all_updates)
+
     print(f"\n[TOTAL] {len(all_updates)} elements trouves")
     print("=" * 50)
 